@@ -1,4 +1,5 @@
 from django.contrib import admin
+from .cache import invalidate_candidate_cache
 from .models import (
     Candidate,
     Education,
@@ -6,15 +7,41 @@ from .models import (
     Skill,
     Project,
     Certification,
+    TechTag,
 )
+from .tasks import queue_resume_parsing
 
 
 @admin.register(Candidate)
 class CandidateAdmin(admin.ModelAdmin):
     list_display = ['id', 'name', 'email', 'parsing_status', 'created_at']
     list_filter = ['parsing_status', 'created_at']
-    readonly_fields = ['created_at', 'parsed_at']
+    readonly_fields = ['created_at', 'updated_at', 'parsed_at']
     search_fields = ['name', 'email', 'phone']
+    actions = ['requeue_parsing']
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # Only the changelist is narrowed; the change form needs every column.
+        changelist_url = f'{self.opts.app_label}_{self.opts.model_name}_changelist'
+        if request.resolver_match and request.resolver_match.url_name == changelist_url:
+            queryset = queryset.only('id', 'name', 'email', 'parsing_status', 'created_at')
+        return queryset
+
+    @admin.action(description='Re-queue parsing for selected pending/failed candidates')
+    def requeue_parsing(self, request, queryset):
+        # Completed and in-flight candidates are skipped: re-parsing them
+        # would insert a second copy of their child rows.
+        candidate_ids = list(
+            queryset.filter(parsing_status__in=['pending', 'failed']).values_list('id', flat=True)
+        )
+        Candidate.objects.filter(id__in=candidate_ids).update(
+            parsing_status='queued', parsing_error=None
+        )
+        invalidate_candidate_cache(*candidate_ids)
+        for candidate_id in candidate_ids:
+            queue_resume_parsing(candidate_id)
+        self.message_user(request, f"Queued {len(candidate_ids)} candidate(s) for parsing.")
 
 
 @admin.register(Education)
@@ -22,6 +49,8 @@ class EducationAdmin(admin.ModelAdmin):
     list_display = ['candidate', 'degree', 'institution', 'start_date', 'end_date']
     list_filter = ['institution']
     search_fields = ['degree', 'institution']
+    list_select_related = ['candidate']
+    autocomplete_fields = ['candidate']
 
 
 @admin.register(Experience)
@@ -29,6 +58,8 @@ class ExperienceAdmin(admin.ModelAdmin):
     list_display = ['candidate', 'position', 'company', 'start_date', 'end_date']
     list_filter = ['company']
     search_fields = ['position', 'company']
+    list_select_related = ['candidate']
+    autocomplete_fields = ['candidate', 'skills_used']
 
 
 @admin.register(Skill)
@@ -36,12 +67,16 @@ class SkillAdmin(admin.ModelAdmin):
     list_display = ['candidate', 'name', 'category', 'proficiency']
     list_filter = ['category', 'proficiency']
     search_fields = ['name']
+    list_select_related = ['candidate']
+    autocomplete_fields = ['candidate']
 
 
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
     list_display = ['candidate', 'name', 'start_date', 'end_date']
     search_fields = ['name', 'description']
+    list_select_related = ['candidate']
+    autocomplete_fields = ['candidate', 'technologies']
 
 
 @admin.register(Certification)
@@ -49,5 +84,11 @@ class CertificationAdmin(admin.ModelAdmin):
     list_display = ['candidate', 'name', 'issuer', 'issue_date']
     list_filter = ['issuer']
     search_fields = ['name', 'issuer']
+    list_select_related = ['candidate']
+    autocomplete_fields = ['candidate']
 
 
+@admin.register(TechTag)
+class TechTagAdmin(admin.ModelAdmin):
+    list_display = ['name']
+    search_fields = ['name']
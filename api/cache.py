@@ -0,0 +1,27 @@
+"""
+Cached responses for the candidate detail and status endpoints.
+"""
+from django.core.cache import cache
+
+# Detail payloads are keyed by the ETag of the row they were rendered
+# from. Every write moves it, including admin edits and child row changes
+# through Candidate.updated_at, so a changed candidate never hits an older
+# body; the TTL only clears out superseded entries. Status changes throughout parsing and is
+# polled hard, so it lives briefly and is invalidated on every write.
+CANDIDATE_DETAIL_CACHE_TIMEOUT = 60
+CANDIDATE_STATUS_CACHE_TIMEOUT = 5
+
+
+def candidate_detail_cache_key(candidate_id: int, etag: str) -> str:
+    return f'cand:detail:{candidate_id}:{etag}'
+
+
+def candidate_status_cache_key(candidate_id: int) -> str:
+    return f'cand:status:{candidate_id}'
+
+
+def invalidate_candidate_cache(*candidate_ids: int) -> None:
+    """Drop cached status responses for the given candidates."""
+    # Detail entries need no invalidation: a write changes the ETag and
+    # with it the key the next request looks up.
+    cache.delete_many([candidate_status_cache_key(candidate_id) for candidate_id in candidate_ids])
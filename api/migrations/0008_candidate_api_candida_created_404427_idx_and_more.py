@@ -0,0 +1,55 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_candidate_document_request_message'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='candidate',
+            index=models.Index(fields=['-created_at'], name='api_candida_created_404427_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidate',
+            index=models.Index(fields=['parsing_status', '-created_at'], name='api_candida_parsing_3b2d65_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['candidate', '-issue_date'], name='api_certifi_candida_ddc7e1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['issuer'], name='api_certifi_issuer_e1326f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['candidate', '-start_date'], name='api_educati_candida_11541f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['institution'], name='api_educati_institu_742a3f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['candidate', '-start_date'], name='api_experie_candida_4d311d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['company'], name='api_experie_company_e9eee8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['candidate', '-start_date'], name='api_project_candida_8c48cf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['candidate', 'name'], name='api_skill_candida_942c8c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['category', 'proficiency'], name='api_skill_categor_014639_idx'),
+        ),
+    ]
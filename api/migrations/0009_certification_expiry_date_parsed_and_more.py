@@ -0,0 +1,99 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_candidate_api_candida_created_404427_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='certification',
+            options={'ordering': ['-issue_date_parsed'], 'verbose_name': 'Certification', 'verbose_name_plural': 'Certifications'},
+        ),
+        migrations.AlterModelOptions(
+            name='education',
+            options={'ordering': ['-start_date_parsed'], 'verbose_name': 'Education', 'verbose_name_plural': 'Education'},
+        ),
+        migrations.AlterModelOptions(
+            name='experience',
+            options={'ordering': ['-start_date_parsed'], 'verbose_name': 'Experience', 'verbose_name_plural': 'Experience'},
+        ),
+        migrations.AlterModelOptions(
+            name='project',
+            options={'ordering': ['-start_date_parsed'], 'verbose_name': 'Project', 'verbose_name_plural': 'Projects'},
+        ),
+        migrations.RemoveIndex(
+            model_name='certification',
+            name='api_certifi_candida_ddc7e1_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='education',
+            name='api_educati_candida_11541f_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='experience',
+            name='api_experie_candida_4d311d_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='api_project_candida_8c48cf_idx',
+        ),
+        migrations.AddField(
+            model_name='certification',
+            name='expiry_date_parsed',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='certification',
+            name='issue_date_parsed',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='education',
+            name='end_date_parsed',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='education',
+            name='start_date_parsed',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='experience',
+            name='end_date_parsed',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='experience',
+            name='start_date_parsed',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='end_date_parsed',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='start_date_parsed',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['candidate', '-issue_date_parsed'], name='api_certifi_candida_e63651_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['candidate', '-start_date_parsed'], name='api_educati_candida_dc5b76_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['candidate', '-start_date_parsed'], name='api_experie_candida_92eb77_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['candidate', '-start_date_parsed'], name='api_project_candida_8bcaf8_idx'),
+        ),
+    ]
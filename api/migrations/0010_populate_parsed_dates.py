@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from dateutil import parser as date_parser
+from django.db import migrations
+
+DEFAULT_DATE = datetime(1900, 1, 1)
+OPEN_ENDED_VALUES = {'present', 'current', 'now', 'ongoing', 'till date', 'to date'}
+
+# model name -> (raw field, parsed field) pairs
+DATE_FIELDS = {
+    'Education': [('start_date', 'start_date_parsed'), ('end_date', 'end_date_parsed')],
+    'Experience': [('start_date', 'start_date_parsed'), ('end_date', 'end_date_parsed')],
+    'Project': [('start_date', 'start_date_parsed'), ('end_date', 'end_date_parsed')],
+    'Certification': [('issue_date', 'issue_date_parsed'), ('expiry_date', 'expiry_date_parsed')],
+}
+
+
+def parse_date(value):
+    if not value or value.strip().lower() in OPEN_ENDED_VALUES:
+        return None
+    try:
+        return date_parser.parse(value, default=DEFAULT_DATE).date()
+    except (ValueError, OverflowError):
+        return None
+
+
+def populate_parsed_dates(apps, schema_editor):
+    for model_name, pairs in DATE_FIELDS.items():
+        model = apps.get_model('api', model_name)
+        rows = list(model.objects.all())
+        for row in rows:
+            for raw_field, parsed_field in pairs:
+                setattr(row, parsed_field, parse_date(getattr(row, raw_field)))
+        model.objects.bulk_update(rows, [parsed for _, parsed in pairs], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_certification_expiry_date_parsed_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_parsed_dates, migrations.RunPython.noop),
+    ]
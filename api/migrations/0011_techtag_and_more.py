@@ -0,0 +1,43 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_populate_parsed_dates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TechTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Tech Tag',
+                'verbose_name_plural': 'Tech Tags',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.RenameField(
+            model_name='experience',
+            old_name='skills_used',
+            new_name='skills_used_json',
+        ),
+        migrations.RenameField(
+            model_name='project',
+            old_name='technologies',
+            new_name='technologies_json',
+        ),
+        migrations.AddField(
+            model_name='experience',
+            name='skills_used',
+            field=models.ManyToManyField(blank=True, related_name='experiences', to='api.techtag'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='technologies',
+            field=models.ManyToManyField(blank=True, related_name='projects', to='api.techtag'),
+        ),
+    ]
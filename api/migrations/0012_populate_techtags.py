@@ -0,0 +1,62 @@
+from django.db import migrations
+
+# (model name, legacy JSON field, M2M field)
+TAG_FIELDS = [
+    ('Experience', 'skills_used_json', 'skills_used'),
+    ('Project', 'technologies_json', 'technologies'),
+]
+
+
+def clean_names(values):
+    return {value.strip() for value in values or [] if isinstance(value, str) and value.strip()}
+
+
+def populate_techtags(apps, schema_editor):
+    TechTag = apps.get_model('api', 'TechTag')
+    for model_name, json_field, m2m_field in TAG_FIELDS:
+        model = apps.get_model('api', model_name)
+        rows = [(row.id, clean_names(getattr(row, json_field))) for row in model.objects.only('id', json_field)]
+        names = set().union(*(row_names for _, row_names in rows))
+        if not names:
+            continue
+
+        TechTag.objects.bulk_create([TechTag(name=name) for name in names], ignore_conflicts=True)
+        tag_ids = dict(TechTag.objects.filter(name__in=names).values_list('name', 'id'))
+
+        through = getattr(model, m2m_field).through
+        owner_field = f'{model_name.lower()}_id'
+        through.objects.bulk_create(
+            [
+                through(**{owner_field: row_id, 'techtag_id': tag_ids[name]})
+                for row_id, row_names in rows
+                for name in row_names
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+
+
+def restore_json_tags(apps, schema_editor):
+    for model_name, json_field, m2m_field in TAG_FIELDS:
+        model = apps.get_model('api', model_name)
+        through = getattr(model, m2m_field).through
+        owner_field = f'{model_name.lower()}_id'
+        names_by_row = {}
+        for row_id, name in through.objects.values_list(owner_field, 'techtag__name'):
+            names_by_row.setdefault(row_id, []).append(name)
+
+        rows = list(model.objects.filter(id__in=names_by_row).only('id'))
+        for row in rows:
+            setattr(row, json_field, sorted(names_by_row[row.id]))
+        model.objects.bulk_update(rows, [json_field], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_techtag_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_techtags, restore_json_tags),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_populate_techtags'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='experience',
+            name='skills_used_json',
+        ),
+        migrations.RemoveField(
+            model_name='project',
+            name='technologies_json',
+        ),
+    ]
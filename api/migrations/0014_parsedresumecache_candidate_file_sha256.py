@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_remove_experience_skills_used_json_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParsedResumeCache',
+            fields=[
+                ('sha256', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('payload', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Parsed Resume Cache',
+                'verbose_name_plural': 'Parsed Resume Cache',
+            },
+        ),
+        migrations.AddField(
+            model_name='candidate',
+            name='file_sha256',
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+    ]
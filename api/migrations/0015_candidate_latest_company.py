@@ -0,0 +1,28 @@
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_latest_company(apps, schema_editor):
+    Candidate = apps.get_model('api', 'Candidate')
+    Experience = apps.get_model('api', 'Experience')
+    latest = Experience.objects.filter(
+        candidate=OuterRef('pk')
+    ).order_by(F('start_date_parsed').desc(nulls_last=True)).values('company')[:1]
+    Candidate.objects.update(latest_company=Coalesce(Subquery(latest), Value('')))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_parsedresumecache_candidate_file_sha256'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidate',
+            name='latest_company',
+            field=models.CharField(blank=True, db_index=True, help_text='Company of the most recent experience entry, set when parsing completes', max_length=255),
+        ),
+        migrations.RunPython(populate_latest_company, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_candidate_latest_company'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='candidate',
+            name='api_candida_created_404427_idx',
+        ),
+        migrations.AddIndex(
+            model_name='candidate',
+            index=models.Index(fields=['-created_at', '-id'], name='api_candida_created_4b1869_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_remove_candidate_api_candida_created_404427_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='candidate',
+            old_name='confidence_score',
+            new_name='confidence_score_decimal',
+        ),
+        migrations.AddField(
+            model_name='candidate',
+            name='confidence_score',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='AI confidence score for parsing quality (0 to 100)', null=True),
+        ),
+    ]
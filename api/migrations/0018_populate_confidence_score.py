@@ -0,0 +1,34 @@
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Cast, Round
+
+
+def decimal_to_percent(apps, schema_editor):
+    Candidate = apps.get_model('api', 'Candidate')
+    Candidate.objects.filter(confidence_score_decimal__isnull=False).update(
+        confidence_score=Cast(
+            Round(F('confidence_score_decimal') * 100),
+            output_field=models.PositiveSmallIntegerField(),
+        )
+    )
+
+
+def percent_to_decimal(apps, schema_editor):
+    Candidate = apps.get_model('api', 'Candidate')
+    Candidate.objects.filter(confidence_score__isnull=False).update(
+        confidence_score_decimal=Cast(
+            F('confidence_score') / 100.0,
+            output_field=models.DecimalField(max_digits=3, decimal_places=2),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_rename_confidence_score_candidate_confidence_score_decimal_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(decimal_to_percent, percent_to_decimal),
+    ]
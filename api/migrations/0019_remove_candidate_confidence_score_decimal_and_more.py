@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_populate_confidence_score'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='candidate',
+            name='confidence_score_decimal',
+        ),
+        migrations.AddConstraint(
+            model_name='candidate',
+            constraint=models.CheckConstraint(check=models.Q(('confidence_score__lte', 100)), name='candidate_confidence_score_lte_100'),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0019_remove_candidate_confidence_score_decimal_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='candidate',
+            name='parsing_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('queued', 'Queued'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20),
+        ),
+    ]
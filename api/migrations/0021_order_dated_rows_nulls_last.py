@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_alter_candidate_parsing_status'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='certification',
+            options={'ordering': [models.OrderBy(models.F('issue_date_parsed'), descending=True, nulls_last=True)], 'verbose_name': 'Certification', 'verbose_name_plural': 'Certifications'},
+        ),
+        migrations.AlterModelOptions(
+            name='education',
+            options={'ordering': [models.OrderBy(models.F('start_date_parsed'), descending=True, nulls_last=True)], 'verbose_name': 'Education', 'verbose_name_plural': 'Education'},
+        ),
+        migrations.AlterModelOptions(
+            name='experience',
+            options={'ordering': [models.OrderBy(models.F('start_date_parsed'), descending=True, nulls_last=True)], 'verbose_name': 'Experience', 'verbose_name_plural': 'Experience'},
+        ),
+        migrations.AlterModelOptions(
+            name='project',
+            options={'ordering': [models.OrderBy(models.F('start_date_parsed'), descending=True, nulls_last=True)], 'verbose_name': 'Project', 'verbose_name_plural': 'Projects'},
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.27 on 2026-10-15 22:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0021_order_dated_rows_nulls_last'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidate',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
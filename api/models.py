@@ -7,6 +7,7 @@ class Candidate(models.Model):
     
     PARSING_STATUS_CHOICES = [
         ('pending', 'Pending'),
+        ('queued', 'Queued'),
         ('processing', 'Processing'),
         ('completed', 'Completed'),
         ('failed', 'Failed'),
@@ -14,7 +15,11 @@ class Candidate(models.Model):
     
     # File and timestamps
     resume_file = models.FileField(upload_to='resumes/')
+    file_sha256 = models.CharField(max_length=64, null=True, blank=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Bumped by full saves and, through signals, by child row changes; the
+    # detail ETag is derived from it.
+    updated_at = models.DateTimeField(auto_now=True)
     parsed_at = models.DateTimeField(null=True, blank=True)
     parsing_status = models.CharField(
         max_length=20, 
@@ -22,12 +27,10 @@ class Candidate(models.Model):
         default='pending'
     )
     parsing_error = models.TextField(null=True, blank=True)
-    confidence_score = models.DecimalField(
-        max_digits=3, 
-        decimal_places=2, 
+    confidence_score = models.PositiveSmallIntegerField(
         null=True, 
         blank=True,
-        help_text="AI confidence score for parsing quality (0.0 to 1.0)"
+        help_text="AI confidence score for parsing quality (0 to 100)"
     )
     
     aadhar_document = models.FileField(upload_to='documents/aadhar/', null=True, blank=True)
@@ -41,9 +44,25 @@ class Candidate(models.Model):
     linkedin_url = models.URLField(blank=True)
     github_url = models.URLField(blank=True)
     summary = models.TextField(blank=True)
+    latest_company = models.CharField(
+        max_length=255,
+        blank=True,
+        db_index=True,
+        help_text="Company of the most recent experience entry, set when parsing completes"
+    )
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id']),
+            models.Index(fields=['parsing_status', '-created_at']),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(confidence_score__lte=100),
+                name='candidate_confidence_score_lte_100',
+            ),
+        ]
         verbose_name = 'Candidate'
         verbose_name_plural = 'Candidates'
     
@@ -64,11 +83,17 @@ class Education(models.Model):
     institution = models.CharField(max_length=255)
     start_date = models.CharField(max_length=50, blank=True)
     end_date = models.CharField(max_length=50, blank=True)
+    start_date_parsed = models.DateField(null=True, blank=True)
+    end_date_parsed = models.DateField(null=True, blank=True)
     gpa = models.CharField(max_length=20, blank=True)
     description = models.TextField(blank=True)
     
     class Meta:
-        ordering = ['-start_date']
+        ordering = [models.F('start_date_parsed').desc(nulls_last=True)]
+        indexes = [
+            models.Index(fields=['candidate', '-start_date_parsed']),
+            models.Index(fields=['institution']),
+        ]
         verbose_name = 'Education'
         verbose_name_plural = 'Education'
     
@@ -87,11 +112,23 @@ class Experience(models.Model):
     position = models.CharField(max_length=255)
     start_date = models.CharField(max_length=50, blank=True)
     end_date = models.CharField(max_length=50, blank=True)
+    start_date_parsed = models.DateField(null=True, blank=True)
+    end_date_parsed = models.DateField(null=True, blank=True)
     description = models.TextField(blank=True)
-    skills_used = models.JSONField(default=list, blank=True)
+    skills_used = models.ManyToManyField(
+        'TechTag',
+        blank=True,
+        related_name='experiences'
+    )
     
     class Meta:
-        ordering = ['-start_date']
+        # Undated entries sort last on every backend (PostgreSQL puts NULLs
+        # first by default), agreeing with how latest_company is picked.
+        ordering = [models.F('start_date_parsed').desc(nulls_last=True)]
+        indexes = [
+            models.Index(fields=['candidate', '-start_date_parsed']),
+            models.Index(fields=['company']),
+        ]
         verbose_name = 'Experience'
         verbose_name_plural = 'Experience'
     
@@ -112,6 +149,10 @@ class Skill(models.Model):
     
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['candidate', 'name']),
+            models.Index(fields=['category', 'proficiency']),
+        ]
         verbose_name = 'Skill'
         verbose_name_plural = 'Skills'
     
@@ -128,13 +169,22 @@ class Project(models.Model):
     )
     name = models.CharField(max_length=255)
     description = models.TextField()
-    technologies = models.JSONField(default=list, blank=True)
+    technologies = models.ManyToManyField(
+        'TechTag',
+        blank=True,
+        related_name='projects'
+    )
     url = models.URLField(blank=True)
     start_date = models.CharField(max_length=50, blank=True)
     end_date = models.CharField(max_length=50, blank=True)
+    start_date_parsed = models.DateField(null=True, blank=True)
+    end_date_parsed = models.DateField(null=True, blank=True)
     
     class Meta:
-        ordering = ['-start_date']
+        ordering = [models.F('start_date_parsed').desc(nulls_last=True)]
+        indexes = [
+            models.Index(fields=['candidate', '-start_date_parsed']),
+        ]
         verbose_name = 'Project'
         verbose_name_plural = 'Projects'
     
@@ -153,11 +203,17 @@ class Certification(models.Model):
     issuer = models.CharField(max_length=255)
     issue_date = models.CharField(max_length=50, blank=True)
     expiry_date = models.CharField(max_length=50, blank=True)
+    issue_date_parsed = models.DateField(null=True, blank=True)
+    expiry_date_parsed = models.DateField(null=True, blank=True)
     credential_id = models.CharField(max_length=255, blank=True)
     credential_url = models.URLField(blank=True)
     
     class Meta:
-        ordering = ['-issue_date']
+        ordering = [models.F('issue_date_parsed').desc(nulls_last=True)]
+        indexes = [
+            models.Index(fields=['candidate', '-issue_date_parsed']),
+            models.Index(fields=['issuer']),
+        ]
         verbose_name = 'Certification'
         verbose_name_plural = 'Certifications'
     
@@ -165,3 +221,28 @@ class Certification(models.Model):
         return f"{self.name} - {self.issuer}"
 
 
+class TechTag(models.Model):
+    """Technology tag shared by experience and project entries."""
+    name = models.CharField(max_length=255, unique=True)
+    
+    class Meta:
+        ordering = ['name']
+        verbose_name = 'Tech Tag'
+        verbose_name_plural = 'Tech Tags'
+    
+    def __str__(self):
+        return self.name
+
+
+class ParsedResumeCache(models.Model):
+    """Parsed resume payloads keyed by the SHA-256 of the uploaded file."""
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        verbose_name = 'Parsed Resume Cache'
+        verbose_name_plural = 'Parsed Resume Cache'
+    
+    def __str__(self):
+        return self.sha256
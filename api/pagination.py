@@ -0,0 +1,11 @@
+from rest_framework.pagination import CursorPagination
+
+
+class CandidateCursorPagination(CursorPagination):
+    """Keyset pagination over candidates, newest first.
+    
+    Each page is a range scan on the (created_at, id) index, so deep pages
+    cost the same as the first one, unlike OFFSET pagination.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 50
@@ -4,13 +4,13 @@ These schemas are used by LangChain for structured output and validation.
 """
 from typing import Optional, List
 from datetime import date
-from pydantic import BaseModel, Field, EmailStr, HttpUrl
+from pydantic import BaseModel, Field
 
 
 class PersonalInfoSchema(BaseModel):
     """Personal information extracted from resume."""
     name: str = Field(description="Full name of the candidate")
-    email: Optional[EmailStr] = Field(None, description="Email address")
+    email: Optional[str] = Field(None, description="Email address")
     phone: Optional[str] = Field(None, description="Phone number")
     location: Optional[str] = Field(None, description="City, State or full address")
     linkedin_url: Optional[str] = Field(None, description="LinkedIn profile URL")
@@ -1,3 +1,4 @@
+from django.urls import reverse
 from rest_framework import serializers
 from .models import (
     Candidate,
@@ -7,19 +8,24 @@ from .models import (
     Project,
     Certification,
 )
+from .services.hashing import sha256_file
+
+
+class ConfidenceScoreField(serializers.ReadOnlyField):
+    """Expose the stored 0-100 confidence score as a 0.0-1.0 fraction."""
+    
+    def to_representation(self, value):
+        return value / 100
 
 
 class CandidateListSerializer(serializers.ModelSerializer):
     """Serializer for listing candidates with minimal fields."""
-    company = serializers.SerializerMethodField()
+    company = serializers.CharField(source='latest_company', read_only=True)
+    confidence_score = ConfidenceScoreField()
     
     class Meta:
         model = Candidate
         fields = ['id', 'name', 'email', 'company', 'parsing_status', 'confidence_score']
-    
-    def get_company(self, obj):
-        latest_experience = obj.experience.first()
-        return latest_experience.company if latest_experience else None
 
 
 class DocumentUploadSerializer(serializers.ModelSerializer):
@@ -27,16 +33,40 @@ class DocumentUploadSerializer(serializers.ModelSerializer):
     class Meta:
         model = Candidate
         fields = ['aadhar_document', 'pan_document']
+    
+    def update(self, instance, validated_data):
+        # Write only the submitted document columns, not the whole row.
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
 
 
 
 
 class CandidateUploadSerializer(serializers.ModelSerializer):
     """Serializer for uploading resumes."""
+    candidate_url = serializers.SerializerMethodField()
+    
     class Meta:
         model = Candidate
-        fields = ['id', 'resume_file', 'created_at']
-        read_only_fields = ['id', 'created_at']
+        fields = ['id', 'resume_file', 'created_at', 'parsing_status', 'candidate_url']
+        read_only_fields = ['id', 'created_at', 'parsing_status']
+    
+    def get_candidate_url(self, obj):
+        # The scheme/host prefix is resolved once per serializer, so a batch
+        # upload doesn't rebuild it for every candidate.
+        if not hasattr(self, '_base_url'):
+            request = self.context.get('request')
+            self._base_url = request.build_absolute_uri('/')[:-1] if request else ''
+        return self._base_url + reverse('candidate-detail', args=[obj.id])
+    
+    def create(self, validated_data):
+        resume_file = validated_data['resume_file']
+        # The upload handlers hash the file while it streams in; fall back
+        # to a separate pass for files that arrived some other way.
+        validated_data['file_sha256'] = getattr(resume_file, 'sha256', None) or sha256_file(resume_file)
+        return super().create(validated_data)
 
 
 class EducationSerializer(serializers.ModelSerializer):
@@ -51,6 +81,8 @@ class EducationSerializer(serializers.ModelSerializer):
 
 class ExperienceSerializer(serializers.ModelSerializer):
     """Serializer for work experience entries."""
+    skills_used = serializers.SlugRelatedField(slug_field='name', many=True, read_only=True)
+    
     class Meta:
         model = Experience
         fields = [
@@ -68,6 +100,8 @@ class SkillSerializer(serializers.ModelSerializer):
 
 class ProjectSerializer(serializers.ModelSerializer):
     """Serializer for projects."""
+    technologies = serializers.SlugRelatedField(slug_field='name', many=True, read_only=True)
+    
     class Meta:
         model = Project
         fields = [
@@ -93,6 +127,7 @@ class CandidateDetailSerializer(serializers.ModelSerializer):
     skills = SkillSerializer(many=True, read_only=True)
     projects = ProjectSerializer(many=True, read_only=True)
     certifications = CertificationSerializer(many=True, read_only=True)
+    confidence_score = ConfidenceScoreField()
     
     class Meta:
         model = Candidate
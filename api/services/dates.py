@@ -0,0 +1,30 @@
+"""
+Helpers for normalising the free-form dates found in resumes.
+"""
+from datetime import date, datetime
+from typing import Optional
+
+from dateutil import parser as date_parser
+
+# Missing components ("2021", "Mar 2021") fall back to the first day/month.
+_DEFAULT_DATE = datetime(1900, 1, 1)
+
+_OPEN_ENDED_VALUES = {'present', 'current', 'now', 'ongoing', 'till date', 'to date'}
+
+
+def parse_resume_date(value: Optional[str]) -> Optional[date]:
+    """
+    Convert a resume date string such as "Jan 2022" or "2019-05" to a date.
+
+    Args:
+        value: Raw date string as extracted from the resume
+
+    Returns:
+        The parsed date, or None for empty, open-ended or unparseable values
+    """
+    if not value or value.strip().lower() in _OPEN_ENDED_VALUES:
+        return None
+    try:
+        return date_parser.parse(value, default=_DEFAULT_DATE).date()
+    except (ValueError, OverflowError):
+        return None
@@ -0,0 +1,24 @@
+"""
+Content hashing for uploaded resume files.
+"""
+import hashlib
+
+# Sequential read throughput levels off around 64KB blocks.
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+def sha256_file(file_obj) -> str:
+    """
+    Compute the SHA-256 hex digest of a Django File without loading it whole.
+    
+    Args:
+        file_obj: Django File or UploadedFile instance
+        
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for chunk in file_obj.chunks(chunk_size=HASH_CHUNK_SIZE):
+        digest.update(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest()
@@ -3,28 +3,33 @@ Resume Parser Service using Google Gemini.
 Extracts structured information from resume files (PDF, DOCX).
 """
 import os
+import io
+import asyncio
+import functools
+import itertools
 import logging
-import json
 import re
-from typing import List, Optional, Tuple
-from datetime import datetime
+import weakref
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime
 from pathlib import Path
 
+from django.db import transaction
 from django.utils import timezone
 from django.conf import settings
+from django.core.cache import cache
 
-import PyPDF2
+import msgspec
+import pymupdf
 from docx import Document
+from google import genai
+from google.genai import types
 
-from api.schemas import (
-    PersonalInfoSchema,
-    EducationSchema,
-    ExperienceSchema,
-    SkillSchema,
-    ProjectSchema,
-    CertificationSchema,
-    ParsedResumeSchema,
-)
+from api.cache import invalidate_candidate_cache
+from api.services.dates import parse_resume_date
+
+from api.schemas import ParsedResumeSchema
+from api.structs import ParsedResume, PARSED_RESUME_DECODER
 from api.models import (
     Candidate,
     Education,
@@ -32,33 +37,154 @@ from api.models import (
     Skill,
     Project,
     Certification,
+    ParsedResumeCache,
+    TechTag,
 )
 
+__all__ = ['ResumeParserService', 'get_gemini_client', 'get_async_gemini_client']
+
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT when persisting parsed child records.
+BULK_BATCH_SIZE = 500
+
+GEMINI_MODEL = 'gemini-2.5-flash'
+GENERATION_CONFIG = {
+    "temperature": 0.1,
+    "response_mime_type": "application/json",
+}
+# The model is constrained to JSON matching ParsedResumeSchema, so responses
+# decode directly with no extraction step. The SDK takes the class itself;
+# raw batch requests carry its JSON Schema.
+RESUME_CONTENT_CONFIG = types.GenerateContentConfig(
+    **GENERATION_CONFIG,
+    response_schema=ParsedResumeSchema,
+)
+RESUME_RESPONSE_SCHEMA = ParsedResumeSchema.model_json_schema()
+
+# Parsed results are cached by file SHA-256 in front of ParsedResumeCache.
+RESUME_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+
+# Less extracted text than this means a scanned or empty file; the model
+# can't do anything useful with it, so the call is skipped.
+MIN_RESUME_TEXT_LENGTH = 50
+
+# Resume text sent to the model is capped at this many tokens. As a
+# heuristic, text of at most MAX_RESUME_TOKENS characters is assumed to fit:
+# English averages about four characters per token, and even Devanagari or
+# CJK text rarely needs more than one token per character. count_tokens is
+# only called for longer resumes.
+MAX_RESUME_TOKENS = 12000
+
+# Headings that start a resume section, most informative first; when a
+# resume is over budget, sections are kept in this order of priority.
+RESUME_SECTIONS = (
+    ('experience', ('experience', 'work experience', 'professional experience', 'employment', 'work history')),
+    ('education', ('education', 'academics', 'qualifications')),
+    ('skills', ('skills', 'technical skills', 'core competencies')),
+    ('projects', ('projects', 'personal projects')),
+    ('certifications', ('certifications', 'certificates', 'licenses')),
+)
+_SECTION_HEADING_RE = re.compile(
+    r'^[ \t]*(' + '|'.join(
+        re.escape(heading) for _, headings in RESUME_SECTIONS for heading in headings
+    ) + r')[ \t]*:?[ \t]*$',
+    re.IGNORECASE | re.MULTILINE,
+)
+_SECTION_BY_HEADING = {
+    heading: section for section, headings in RESUME_SECTIONS for heading in headings
+}
+_SECTION_PRIORITY = {section: rank for rank, (section, _) in enumerate(RESUME_SECTIONS)}
+
+# Text columns copied straight from each decoded struct onto its model.
+# Missing values are stored as '' because the columns are not nullable.
+EDUCATION_FIELDS = frozenset({
+    'degree', 'institution', 'start_date', 'end_date', 'gpa', 'description',
+})
+EXPERIENCE_FIELDS = frozenset({
+    'company', 'position', 'start_date', 'end_date', 'description',
+})
+SKILL_FIELDS = frozenset({'name', 'proficiency', 'category'})
+PROJECT_FIELDS = frozenset({
+    'name', 'description', 'url', 'start_date', 'end_date',
+})
+CERTIFICATION_FIELDS = frozenset({
+    'name', 'issuer', 'issue_date', 'expiry_date', 'credential_id', 'credential_url',
+})
+
+# Batch Mode job states after which the job will not change again.
+BATCH_TERMINAL_STATES = {
+    'JOB_STATE_SUCCEEDED',
+    'JOB_STATE_FAILED',
+    'JOB_STATE_CANCELLED',
+    'JOB_STATE_EXPIRED',
+}
+# Gemini expires batch jobs still pending or running after 48 hours, so a
+# job is never polled for longer than this.
+BATCH_JOB_LIFETIME = 60 * 60 * 48
+
+# The instructions never change, so the prompt is assembled
+# once at import; only the resume text is spliced in per call.
+RESUME_PROMPT_HEADER = """You are a resume parser. Extract ALL information from the resume text below.
+
+Give every extracted item a confidence_score from 0 to 100.
+
+Resume text:
+"""
+RESUME_PROMPT_FOOTER = "\n\nResponse (JSON only):"
+
+
+def _get_api_key() -> str:
+    """Read the Gemini API key from the environment."""
+    api_key = os.getenv('GOOGLE_API_KEY')
+    if not api_key:
+        raise ValueError(
+            "GOOGLE_API_KEY environment variable not set. "
+            "Please add it to your .env file."
+        )
+    return api_key
+
+
+@functools.lru_cache(maxsize=1)
+def get_gemini_client() -> genai.Client:
+    """Build the Gemini client once per process so its connection pool is reused."""
+    return genai.Client(api_key=_get_api_key())
+
+
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_gemini_client():
+    """
+    Return the async Gemini client for the running event loop.
+    
+    Async connections belong to the loop that opened them. Under ASGI there
+    is one loop per process, so the client is shared like get_gemini_client();
+    under WSGI each request gets a fresh loop and therefore a fresh client.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = genai.Client(api_key=_get_api_key()).aio
+    return client
+
+
+def _model_fields(item: msgspec.Struct, fields: frozenset) -> dict:
+    """Project a decoded struct onto model column kwargs, mapping None to ''."""
+    return {name: getattr(item, name) or '' for name in fields}
+
+
+def _clean_tag_names(values: Optional[List[str]]) -> set:
+    """Strip and deduplicate technology names, dropping blanks."""
+    return {value.strip() for value in values or [] if value and value.strip()}
+
 
 class ResumeParserService:
     """Service for parsing resumes using Gemini."""
     
     def __init__(self):
-        """Initialize the parser with Gemini model."""
-        import google.generativeai as genai
-        
-        api_key = os.getenv('GOOGLE_API_KEY')
-        if not api_key:
-            raise ValueError(
-                "GOOGLE_API_KEY environment variable not set. "
-                "Please add it to your .env file."
-            )
-        
-        genai.configure(api_key=api_key)
-        
-        self.model = genai.GenerativeModel(
-            'gemini-2.5-flash',
-            generation_config={
-                "temperature": 0.1,
-            }
-        )
+        """Initialize the parser with the shared Gemini client."""
+        self.client = get_gemini_client()
     
     def extract_text(self, file_path: str) -> str:
         """
@@ -93,50 +219,172 @@ class ResumeParserService:
     
     def _extract_pdf(self, file_path: Path) -> str:
         """Extract text from PDF file."""
-        text = []
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text.append(page.extract_text())
-        return '\n'.join(text)
+        # PyMuPDF documents must not be shared across threads, so the
+        # document is opened and read entirely on the calling thread.
+        with pymupdf.open(file_path) as doc:
+            return '\n'.join(page.get_text() for page in doc)
     
     def _extract_docx(self, file_path: Path) -> str:
         """Extract text from DOCX file."""
         doc = Document(file_path)
-        return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+        # doc.paragraphs skips tables, which many resume templates use for
+        # layout; their cells are read after the body text. row.cells repeats
+        # a merged cell once per grid column it spans, so each underlying
+        # <w:tc> element is read only once.
+        seen = set()
+        cells = []
+        for table in doc.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    if cell._tc not in seen:
+                        seen.add(cell._tc)
+                        cells.append(cell)
+        return '\n'.join(
+            text
+            for text in itertools.chain(
+                (paragraph.text for paragraph in doc.paragraphs),
+                (cell.text for cell in cells),
+            )
+            if text
+        )
     
-    def _extract_json_from_response(self, response_text: str) -> dict:
+    def _decode_response(self, response_text: str) -> ParsedResume:
         """
-        Extract JSON from model response, handling markdown code blocks.
+        Decode the model response into a ParsedResume.
         
         Args:
             response_text: Raw response text from the model
             
         Returns:
-            Parsed JSON dictionary
+            Decoded and validated resume data
         """
-        try:
-            return json.loads(response_text)
-        except json.JSONDecodeError:
-            pass
+        return PARSED_RESUME_DECODER.decode(response_text)
+    
+    def _prepare_text(self, file_path: str) -> str:
+        """
+        Extract resume text for the prompt, rejecting files with no text layer.
         
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
-                pass
+        Args:
+            file_path: Path to the resume file
+            
+        Returns:
+            Extracted text, trimmed to the token budget
+        """
+        text = self.extract_text(file_path)
+        if len(text.strip()) < MIN_RESUME_TEXT_LENGTH:
+            raise ValueError("Empty or non-text PDF (may need OCR)")
+        return self._fit_to_token_budget(text)
+    
+    def _fit_to_token_budget(self, text: str) -> str:
+        """
+        Trim resume text to MAX_RESUME_TOKENS, dropping whole sections.
         
-        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group(0))
-            except json.JSONDecodeError:
-                pass
+        The text before the first heading (name, contact details, summary)
+        is always kept; the remaining sections are added by priority while
+        they fit, then reassembled in their original order. A top-priority
+        section that doesn't fit is cut at a line break to fill the budget
+        rather than dropped.
+        
+        Args:
+            text: Extracted resume text
+            
+        Returns:
+            Text that fits the token budget
+        """
+        if len(text) <= MAX_RESUME_TOKENS:
+            return text
+        
+        total_tokens = self.client.models.count_tokens(
+            model=GEMINI_MODEL, contents=text
+        ).total_tokens
+        if total_tokens <= MAX_RESUME_TOKENS:
+            return text
+        
+        # Estimate each slice's tokens from its share of the characters.
+        chars_per_token = len(text) / total_tokens
+        budget = int(MAX_RESUME_TOKENS * chars_per_token)
+        
+        matches = list(_SECTION_HEADING_RE.finditer(text))
+        if not matches:
+            cut = text.rfind('\n', 0, budget)
+            return text[:cut if cut > 0 else budget]
+        
+        header = text[:matches[0].start()]
+        ends = [match.start() for match in matches[1:]] + [len(text)]
+        sections = [
+            (text[match.start():end], _SECTION_PRIORITY[_SECTION_BY_HEADING[match.group(1).lower()]])
+            for match, end in zip(matches, ends)
+        ]
+        
+        remaining = budget - len(header)
+        top_priority = min(priority for _, priority in sections)
+        kept = {}
+        for index in sorted(range(len(sections)), key=lambda i: sections[i][1]):
+            section, priority = sections[index]
+            if len(section) <= remaining:
+                kept[index] = section
+                remaining -= len(section)
+            elif priority == top_priority and remaining > 0:
+                # Usually the experience section of a long resume; dropping
+                # it would lose the most useful text, e.g. latest_company.
+                cut = section.rfind('\n', 0, remaining)
+                kept[index] = section[:cut + 1 if cut > 0 else remaining]
+                remaining = 0
+        
+        logger.info(
+            f"Resume text is {total_tokens} tokens; kept {len(kept)} of "
+            f"{len(sections)} sections to fit {MAX_RESUME_TOKENS}"
+        )
+        return header[:budget] + ''.join(kept[index] for index in sorted(kept))
+    
+    def _get_cached_result(self, candidate: Candidate) -> Optional[ParsedResume]:
+        """Return a previously parsed result for an identical file, if any."""
+        if not candidate.file_sha256:
+            return None
+        
+        cache_key = f'resume:{candidate.file_sha256}'
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return PARSED_RESUME_DECODER.decode(cached)
+        
+        entry = ParsedResumeCache.objects.filter(sha256=candidate.file_sha256).first()
+        if entry is None:
+            return None
+        parsed_data = msgspec.convert(entry.payload, ParsedResume, strict=False)
+        cache.set(cache_key, msgspec.json.encode(parsed_data), timeout=RESUME_CACHE_TIMEOUT)
+        return parsed_data
+    
+    def _cache_result(self, candidate: Candidate, parsed_data: ParsedResume) -> None:
+        """Store a parsed result so re-uploads of the same file skip the model call."""
+        if not candidate.file_sha256:
+            return
+        
+        ParsedResumeCache.objects.update_or_create(
+            sha256=candidate.file_sha256,
+            defaults={'payload': msgspec.to_builtins(parsed_data)},
+        )
+        cache.set(
+            f'resume:{candidate.file_sha256}',
+            msgspec.json.encode(parsed_data),
+            timeout=RESUME_CACHE_TIMEOUT,
+        )
+    
+    def _update_status(self, candidate: Candidate, parsing_status: str, **fields) -> None:
+        """
+        Record a parsing status transition with a narrow UPDATE.
         
-        raise ValueError(f"Could not extract valid JSON from response: {response_text[:200]}...")
+        Args:
+            candidate: Candidate model instance, updated in place
+            parsing_status: New parsing status
+            **fields: Other Candidate columns to write in the same statement
+        """
+        fields['parsing_status'] = parsing_status
+        Candidate.objects.filter(pk=candidate.pk).update(**fields)
+        invalidate_candidate_cache(candidate.pk)
+        for name, value in fields.items():
+            setattr(candidate, name, value)
     
-    def parse_resume(self, candidate: Candidate) -> ParsedResumeSchema:
+    def parse_resume(self, candidate: Candidate) -> ParsedResume:
         """
         Main orchestration method - parses entire resume in one API call.
         
@@ -144,122 +392,177 @@ class ResumeParserService:
             candidate: Candidate model instance
             
         Returns:
-            ParsedResumeSchema with all extracted data
+            ParsedResume with all extracted data
         """
         try:
-            candidate.parsing_status = 'processing'
-            candidate.save()
+            self._update_status(candidate, 'processing')
+            
+            cached_data = self._get_cached_result(candidate)
+            if cached_data is not None:
+                logger.info(f"Using cached parse result for candidate {candidate.id}")
+                return cached_data
             
             file_path = candidate.resume_file.path
             logger.info(f"Parsing resume from: {file_path}")
-            text = self.extract_text(file_path)
-            
-            prompt = f"""You are a resume parser. Extract ALL information from the resume text below.
-
-CRITICAL: Return your response as a VALID JSON object ONLY. Do not include any explanatory text, markdown formatting, or code blocks. Just the raw JSON.
-
-JSON Schema:
-{{
-  "personal_info": {{
-    "name": "string (required)",
-    "email": "string or null",
-    "phone": "string or null",
-    "location": "string or null",
-    "linkedin_url": "string or null",
-    "github_url": "string or null",
-    "summary": "string or null",
-    "confidence_score": "integer 0-100 (required)"
-  }},
-  "education": [
-    {{
-      "degree": "string (required)",
-      "institution": "string (required)",
-      "start_date": "string or null",
-      "end_date": "string or null",
-      "gpa": "string or null",
-      "description": "string or null",
-      "confidence_score": "integer 0-100 (required)"
-    }}
-  ],
-  "experience": [
-    {{
-      "company": "string (required)",
-      "position": "string (required)",
-      "start_date": "string or null",
-      "end_date": "string or null",
-      "description": "string or null",
-      "skills_used": ["array of strings or null"],
-      "confidence_score": "integer 0-100 (required)"
-    }}
-  ],
-  "skills": [
-    {{
-      "name": "string (required)",
-      "proficiency": "string or null",
-      "category": "string or null",
-      "confidence_score": "integer 0-100 (required)"
-    }}
-  ],
-  "projects": [
-    {{
-      "name": "string (required)",
-      "description": "string (required)",
-      "technologies": ["array of strings or null"],
-      "url": "string or null",
-      "start_date": "string or null",
-      "end_date": "string or null",
-      "confidence_score": "integer 0-100 (required)"
-    }}
-  ],
-  "certifications": [
-    {{
-      "name": "string (required)",
-      "issuer": "string (required)",
-      "issue_date": "string or null",
-      "expiry_date": "string or null",
-      "credential_id": "string or null",
-      "credential_url": "string or null",
-      "confidence_score": "integer 0-100 (required)"
-    }}
-  ]
-}}
-
-Resume text:
-{text}
-
-Response (JSON only):"""
-            
-            response = self.model.generate_content(prompt)
-            result_json = self._extract_json_from_response(response.text)
+            text = self._prepare_text(file_path)
             
-            personal_info = PersonalInfoSchema(**result_json.get('personal_info', {}))
-            education = [EducationSchema(**edu) for edu in result_json.get('education', [])]
-            experience = [ExperienceSchema(**exp) for exp in result_json.get('experience', [])]
-            skills = [SkillSchema(**skill) for skill in result_json.get('skills', [])]
-            projects = [ProjectSchema(**proj) for proj in result_json.get('projects', [])]
-            certifications = [CertificationSchema(**cert) for cert in result_json.get('certifications', [])]
+            prompt = f"{RESUME_PROMPT_HEADER}{text}{RESUME_PROMPT_FOOTER}"
             
-            parsed_data = ParsedResumeSchema(
-                personal_info=personal_info,
-                education=education,
-                experience=experience,
-                skills=skills,
-                projects=projects,
-                certifications=certifications,
+            response = self.client.models.generate_content(
+                model=GEMINI_MODEL,
+                contents=prompt,
+                config=RESUME_CONTENT_CONFIG,
             )
+            parsed_data = self._decode_response(response.text)
+            
+            self._cache_result(candidate, parsed_data)
             
             logger.info(f"Successfully parsed resume for candidate {candidate.id}")
-            logger.info(f"Extracted: {len(education)} education, {len(experience)} experience, {len(skills)} skills")
+            logger.info(
+                f"Extracted: {len(parsed_data.education)} education, "
+                f"{len(parsed_data.experience)} experience, {len(parsed_data.skills)} skills"
+            )
             return parsed_data
             
         except Exception as e:
-            logger.error(f"Error parsing resume: {e}")
-            candidate.parsing_status = 'failed'
-            candidate.parsing_error = str(e)
-            candidate.save()
+            logger.exception("Error parsing resume for candidate %s", candidate.id)
+            self._update_status(candidate, 'failed', parsing_error=str(e))
             raise
     
-    def calculate_confidence_score(self, parsed_data: ParsedResumeSchema) -> float:
+    def parse_resumes_batch(self, candidates: List[Candidate]) -> Optional[str]:
+        """
+        Submit resumes to Gemini Batch Mode instead of parsing them inline.
+        
+        Batch jobs cost half as much and have their own rate limits, but
+        may take up to 24 hours; results are picked up later with
+        collect_batch_results. Cached files are saved immediately and files
+        whose text can't be extracted are marked failed.
+        
+        Args:
+            candidates: Candidate model instances to parse
+            
+        Returns:
+            Batch job name, or None if nothing was submitted
+        """
+        lines = []
+        submitted_ids = []
+        for candidate in candidates:
+            try:
+                self._update_status(candidate, 'processing')
+                
+                cached_data = self._get_cached_result(candidate)
+                if cached_data is not None:
+                    logger.info(f"Using cached parse result for candidate {candidate.id}")
+                    self.save_to_database(candidate, cached_data)
+                    continue
+                
+                text = self._prepare_text(candidate.resume_file.path)
+            except Exception as e:
+                logger.exception("Error preparing batch request for candidate %s", candidate.id)
+                self._update_status(candidate, 'failed', parsing_error=str(e))
+                continue
+            
+            lines.append(msgspec.json.encode({
+                'key': str(candidate.id),
+                'request': {
+                    'contents': [{'role': 'user', 'parts': [
+                        {'text': f"{RESUME_PROMPT_HEADER}{text}{RESUME_PROMPT_FOOTER}"}
+                    ]}],
+                    'generation_config': {
+                        **GENERATION_CONFIG,
+                        'response_json_schema': RESUME_RESPONSE_SCHEMA,
+                    },
+                },
+            }))
+            submitted_ids.append(candidate.id)
+        
+        if not lines:
+            return None
+        
+        try:
+            requests_file = self.client.files.upload(
+                file=io.BytesIO(b'\n'.join(lines)),
+                config={'display_name': 'resume-parse-batch', 'mime_type': 'jsonl'},
+            )
+            job = self.client.batches.create(
+                model=GEMINI_MODEL,
+                src=requests_file.name,
+                config={'display_name': f'resume-parse-{len(lines)}'},
+            )
+        except Exception as e:
+            logger.exception("Error submitting batch job for %d resumes", len(lines))
+            self.fail_batch_candidates(submitted_ids, f"Could not submit batch job: {e}")
+            return None
+        logger.info(f"Submitted {len(lines)} resumes as batch job {job.name}")
+        return job.name
+    
+    def collect_batch_results(self, job_name: str, candidate_ids: List[int]) -> bool:
+        """
+        Save the results of a finished batch job.
+        
+        Args:
+            job_name: Name returned by parse_resumes_batch
+            candidate_ids: Candidates submitted in the job
+            
+        Returns:
+            False if the job is still running, True once it has been handled
+        """
+        job = self.client.batches.get(name=job_name)
+        state = job.state.name
+        if state not in BATCH_TERMINAL_STATES:
+            return False
+        
+        candidates = Candidate.objects.in_bulk(candidate_ids)
+        if state != 'JOB_STATE_SUCCEEDED':
+            logger.error(f"Batch job {job_name} ended in state {state}")
+            self.fail_batch_candidates(candidate_ids, f"Batch job ended in state {state}")
+            return True
+        
+        results: Dict[str, dict] = {}
+        for line in self.client.files.download(file=job.dest.file_name).splitlines():
+            if line.strip():
+                item = msgspec.json.decode(line)
+                results[item.get('key')] = item
+        
+        for candidate_id, candidate in candidates.items():
+            if candidate.parsing_status == 'completed':
+                continue
+            try:
+                item = results.get(str(candidate_id))
+                if item is None:
+                    raise ValueError("No result returned by batch job")
+                if 'error' in item:
+                    raise ValueError(f"Batch request failed: {item['error']}")
+                
+                response_text = item['response']['candidates'][0]['content']['parts'][0]['text']
+                parsed_data = self._decode_response(response_text)
+                self._cache_result(candidate, parsed_data)
+                self.save_to_database(candidate, parsed_data)
+            except Exception as e:
+                logger.exception("Error saving batch result for candidate %s", candidate_id)
+                if candidate.parsing_status != 'failed':
+                    self._update_status(candidate, 'failed', parsing_error=str(e))
+        
+        return True
+    
+    @staticmethod
+    def fail_batch_candidates(candidate_ids: List[int], error: str) -> None:
+        """
+        Mark candidates of a batch that are still queued or processing as failed.
+        
+        A static method so tasks can call it when the service itself could
+        not be built, e.g. without an API key.
+        
+        Args:
+            candidate_ids: Candidates submitted in the batch
+            error: Message stored in parsing_error
+        """
+        Candidate.objects.filter(
+            pk__in=candidate_ids, parsing_status__in=['queued', 'processing']
+        ).update(parsing_status='failed', parsing_error=error)
+        invalidate_candidate_cache(*candidate_ids)
+    
+    def calculate_confidence_score(self, parsed_data: ParsedResume) -> int:
         """
         Calculate average confidence score from AI-provided scores.
         
@@ -267,7 +570,7 @@ Response (JSON only):"""
             parsed_data: Parsed resume data with confidence scores
             
         Returns:
-            Average confidence score between 0.0 and 1.0
+            Average confidence score between 0 and 100
         """
         scores = []
         
@@ -289,16 +592,37 @@ Response (JSON only):"""
             scores.append(cert.confidence_score)
         
         if not scores:
-            return 0.0
+            return 0
         
-        average_score = sum(scores) / len(scores)
-        return round(average_score / 100, 2)
+        average_score = round(sum(scores) / len(scores))
+        return min(max(average_score, 0), 100)
 
     
+    def _get_tech_tags(self, parsed_data: ParsedResume) -> dict:
+        """
+        Ensure a TechTag row exists for every technology in the parsed data.
+        
+        Args:
+            parsed_data: Validated parsed resume data
+            
+        Returns:
+            Mapping of tag name to TechTag instance
+        """
+        names = set()
+        for exp in parsed_data.experience:
+            names |= _clean_tag_names(exp.skills_used)
+        for project in parsed_data.projects:
+            names |= _clean_tag_names(project.technologies)
+        if not names:
+            return {}
+        
+        TechTag.objects.bulk_create([TechTag(name=name) for name in names], ignore_conflicts=True)
+        return {tag.name: tag for tag in TechTag.objects.filter(name__in=names)}
+    
     def save_to_database(
         self, 
         candidate: Candidate, 
-        parsed_data: ParsedResumeSchema
+        parsed_data: ParsedResume
     ) -> Candidate:
         """
         Save parsed data to Django models.
@@ -319,6 +643,12 @@ Response (JSON only):"""
             candidate.linkedin_url = personal.linkedin_url or ''
             candidate.github_url = personal.github_url or ''
             candidate.summary = personal.summary or ''
+            latest_experience = max(
+                parsed_data.experience,
+                key=lambda exp: parse_resume_date(exp.start_date) or date.min,
+                default=None,
+            )
+            candidate.latest_company = latest_experience.company if latest_experience else ''
             candidate.parsed_at = timezone.now()
             candidate.parsing_status = 'completed'
             
@@ -326,66 +656,83 @@ Response (JSON only):"""
             candidate.confidence_score = confidence_score
             logger.info(f"Calculated average confidence score: {confidence_score}")
             
-            candidate.save()
-            
-            for edu in parsed_data.education:
-                Education.objects.create(
-                    candidate=candidate,
-                    degree=edu.degree,
-                    institution=edu.institution,
-                    start_date=edu.start_date or '',
-                    end_date=edu.end_date or '',
-                    gpa=edu.gpa or '',
-                    description=edu.description or '',
-                )
-            
-            for exp in parsed_data.experience:
-                Experience.objects.create(
-                    candidate=candidate,
-                    company=exp.company,
-                    position=exp.position,
-                    start_date=exp.start_date or '',
-                    end_date=exp.end_date or '',
-                    description=exp.description or '',
-                    skills_used=exp.skills_used or [],
-                )
-            
-            for skill in parsed_data.skills:
-                Skill.objects.create(
-                    candidate=candidate,
-                    name=skill.name,
-                    proficiency=skill.proficiency or '',
-                    category=skill.category or '',
-                )
-            
-            for project in parsed_data.projects:
-                Project.objects.create(
-                    candidate=candidate,
-                    name=project.name,
-                    description=project.description,
-                    technologies=project.technologies or [],
-                    url=project.url or '',
-                    start_date=project.start_date or '',
-                    end_date=project.end_date or '',
-                )
-            
-            for cert in parsed_data.certifications:
-                Certification.objects.create(
-                    candidate=candidate,
-                    name=cert.name,
-                    issuer=cert.issuer,
-                    issue_date=cert.issue_date or '',
-                    expiry_date=cert.expiry_date or '',
-                    credential_id=cert.credential_id or '',
-                    credential_url=cert.credential_url or '',
-                )
+            with transaction.atomic():
+                # Lock the row so a retried or duplicate task can't insert
+                # the child rows twice.
+                locked = Candidate.objects.select_for_update().only('parsing_status').get(pk=candidate.pk)
+                if locked.parsing_status == 'completed':
+                    logger.info(f"Candidate {candidate.id} already saved by another worker, skipping")
+                    return candidate
+                
+                candidate.save(update_fields=[
+                    'name', 'email', 'phone', 'location', 'linkedin_url',
+                    'github_url', 'summary', 'latest_company', 'parsed_at',
+                    'parsing_status', 'confidence_score',
+                ])
+                
+                tech_tags = self._get_tech_tags(parsed_data)
+                
+                Education.objects.bulk_create([
+                    Education(
+                        candidate=candidate,
+                        **_model_fields(edu, EDUCATION_FIELDS),
+                        start_date_parsed=parse_resume_date(edu.start_date),
+                        end_date_parsed=parse_resume_date(edu.end_date),
+                    )
+                    for edu in parsed_data.education
+                ], batch_size=BULK_BATCH_SIZE)
+                
+                experiences = Experience.objects.bulk_create([
+                    Experience(
+                        candidate=candidate,
+                        **_model_fields(exp, EXPERIENCE_FIELDS),
+                        start_date_parsed=parse_resume_date(exp.start_date),
+                        end_date_parsed=parse_resume_date(exp.end_date),
+                    )
+                    for exp in parsed_data.experience
+                ], batch_size=BULK_BATCH_SIZE)
+                ExperienceTag = Experience.skills_used.through
+                ExperienceTag.objects.bulk_create([
+                    ExperienceTag(experience_id=row.id, techtag_id=tech_tags[name].id)
+                    for row, exp in zip(experiences, parsed_data.experience)
+                    for name in _clean_tag_names(exp.skills_used)
+                ], batch_size=BULK_BATCH_SIZE)
+                
+                Skill.objects.bulk_create([
+                    Skill(candidate=candidate, **_model_fields(skill, SKILL_FIELDS))
+                    for skill in parsed_data.skills
+                ], batch_size=BULK_BATCH_SIZE)
+                
+                projects = Project.objects.bulk_create([
+                    Project(
+                        candidate=candidate,
+                        **_model_fields(project, PROJECT_FIELDS),
+                        start_date_parsed=parse_resume_date(project.start_date),
+                        end_date_parsed=parse_resume_date(project.end_date),
+                    )
+                    for project in parsed_data.projects
+                ], batch_size=BULK_BATCH_SIZE)
+                ProjectTag = Project.technologies.through
+                ProjectTag.objects.bulk_create([
+                    ProjectTag(project_id=row.id, techtag_id=tech_tags[name].id)
+                    for row, project in zip(projects, parsed_data.projects)
+                    for name in _clean_tag_names(project.technologies)
+                ], batch_size=BULK_BATCH_SIZE)
+                
+                Certification.objects.bulk_create([
+                    Certification(
+                        candidate=candidate,
+                        **_model_fields(cert, CERTIFICATION_FIELDS),
+                        issue_date_parsed=parse_resume_date(cert.issue_date),
+                        expiry_date_parsed=parse_resume_date(cert.expiry_date),
+                    )
+                    for cert in parsed_data.certifications
+                ], batch_size=BULK_BATCH_SIZE)
             
             logger.info(f"Successfully saved parsed data for candidate {candidate.id}")
             return candidate
             
         except Exception as e:
             logger.error(f"Error saving to database: {e}")
-            candidate.parsing_status = 'failed'
-            candidate.parsing_error = f"Database error: {str(e)}"
-            candidate.save()
+            self._update_status(candidate, 'failed', parsing_error=f"Database error: {str(e)}")
             raise
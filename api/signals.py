@@ -0,0 +1,37 @@
+"""
+Keep cached candidate responses current when candidates or their rows change.
+
+Candidate writes drop the cached status; child row writes bump the
+candidate's updated_at, which moves the detail ETag and with it the detail
+cache key. QuerySet.update() and bulk_create() don't send these signals;
+callers that use them invalidate explicitly.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .cache import invalidate_candidate_cache
+from .models import Candidate, Certification, Education, Experience, Project, Skill
+
+
+def _invalidate_on_commit(candidate_id: int) -> None:
+    # Deferred so a concurrent read can't re-cache rows this transaction is
+    # still changing; runs immediately outside a transaction.
+    transaction.on_commit(lambda: invalidate_candidate_cache(candidate_id))
+
+
+@receiver([post_save, post_delete], sender=Candidate)
+def invalidate_candidate(sender, instance, **kwargs):
+    _invalidate_on_commit(instance.pk)
+
+
+def touch_candidate(sender, instance, **kwargs):
+    # Child rows are part of the detail payload but not of the status, so
+    # only the candidate's ETag needs to move. update() sends no signals.
+    Candidate.objects.filter(pk=instance.candidate_id).update(updated_at=timezone.now())
+
+
+for model in (Education, Experience, Skill, Project, Certification):
+    post_save.connect(touch_candidate, sender=model)
+    post_delete.connect(touch_candidate, sender=model)
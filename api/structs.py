@@ -0,0 +1,112 @@
+"""
+msgspec mirrors of the resume schemas, used to decode model output.
+
+The Pydantic schemas in api.schemas only describe the expected shape to the
+model; these structs decode the raw JSON response in a single pass in C and
+are where values are cleaned up. Keep the two in sync when adding fields.
+"""
+import re
+from typing import List, Optional
+
+import msgspec
+
+# Shape checks only; resumes don't need RFC-complete validation.
+EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+URL_RE = re.compile(r'^(?:https?://)?(?:[\w-]+\.)+[a-z]{2,}(?:[/?#]\S*)?$', re.IGNORECASE)
+
+
+class ResumeStruct(msgspec.Struct, kw_only=True):
+    """Base for resume structs: trims surrounding whitespace from strings."""
+    
+    def __post_init__(self):
+        for name in self.__struct_fields__:
+            value = getattr(self, name)
+            if isinstance(value, str):
+                setattr(self, name, value.strip())
+
+
+class PersonalInfo(ResumeStruct, kw_only=True):
+    """Personal information extracted from resume."""
+    name: str
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    location: Optional[str] = None
+    linkedin_url: Optional[str] = None
+    github_url: Optional[str] = None
+    summary: Optional[str] = None
+    confidence_score: int
+    
+    def __post_init__(self):
+        super().__post_init__()
+        if self.email is not None and not EMAIL_RE.match(self.email):
+            self.email = None
+        if self.linkedin_url is not None and not URL_RE.match(self.linkedin_url):
+            self.linkedin_url = None
+        if self.github_url is not None and not URL_RE.match(self.github_url):
+            self.github_url = None
+
+
+class Education(ResumeStruct, kw_only=True):
+    """Education details from resume."""
+    degree: str
+    institution: str
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    gpa: Optional[str] = None
+    description: Optional[str] = None
+    confidence_score: int
+
+
+class Experience(ResumeStruct, kw_only=True):
+    """Work experience details from resume."""
+    company: str
+    position: str
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    description: Optional[str] = None
+    skills_used: Optional[List[str]] = None
+    confidence_score: int
+
+
+class Skill(ResumeStruct, kw_only=True):
+    """Skill extracted from resume."""
+    name: str
+    proficiency: Optional[str] = None
+    category: Optional[str] = None
+    confidence_score: int
+
+
+class Project(ResumeStruct, kw_only=True):
+    """Project details from resume."""
+    name: str
+    description: str
+    technologies: Optional[List[str]] = None
+    url: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    confidence_score: int
+
+
+class Certification(ResumeStruct, kw_only=True):
+    """Certification details from resume."""
+    name: str
+    issuer: str
+    issue_date: Optional[str] = None
+    expiry_date: Optional[str] = None
+    credential_id: Optional[str] = None
+    credential_url: Optional[str] = None
+    confidence_score: int
+
+
+class ParsedResume(ResumeStruct, kw_only=True):
+    """Complete parsed resume data."""
+    personal_info: PersonalInfo
+    education: List[Education] = []
+    experience: List[Experience] = []
+    skills: List[Skill] = []
+    projects: List[Project] = []
+    certifications: List[Certification] = []
+
+
+# Non-strict so numeric strings such as "85" still decode into int fields.
+PARSED_RESUME_DECODER = msgspec.json.Decoder(ParsedResume, strict=False)
@@ -0,0 +1,146 @@
+"""
+Celery tasks for background resume processing.
+"""
+import logging
+from typing import List
+
+from celery import shared_task
+from celery.exceptions import Retry
+from celery.utils.time import get_exponential_backoff_interval
+from django.conf import settings
+from google.genai import errors as genai_errors
+
+from .cache import invalidate_candidate_cache
+from .models import Candidate
+from .services.resume_parser import BATCH_JOB_LIFETIME, ResumeParserService
+
+logger = logging.getLogger(__name__)
+
+
+# Gemini rate limits (HTTP 429) are retried with exponential backoff.
+@shared_task(bind=True, acks_late=True, max_retries=5)
+def parse_resume_task(self, candidate_id: int) -> None:
+    """
+    Parse an uploaded resume and persist the extracted data.
+    
+    Safe to run more than once for the same candidate: completed
+    candidates are skipped. Any error other than a retried rate limit
+    marks the candidate failed, so it never stays queued.
+    
+    Args:
+        candidate_id: Primary key of the Candidate to parse
+    """
+    try:
+        candidate = Candidate.objects.get(id=candidate_id)
+    except Candidate.DoesNotExist:
+        logger.warning(f"Candidate {candidate_id} no longer exists, skipping parse")
+        return
+    
+    if candidate.parsing_status == 'completed':
+        logger.info(f"Candidate {candidate_id} already parsed, skipping")
+        return
+    
+    try:
+        parser_service = ResumeParserService()
+        try:
+            parsed_data = parser_service.parse_resume(candidate)
+        except genai_errors.ClientError as e:
+            if e.code != 429 or self.request.retries >= self.max_retries:
+                raise
+            # parse_resume marked the candidate failed, but it will be retried.
+            Candidate.objects.filter(pk=candidate_id).update(parsing_status='queued')
+            invalidate_candidate_cache(candidate_id)
+            raise self.retry(exc=e, countdown=get_exponential_backoff_interval(
+                factor=1, retries=self.request.retries, maximum=600, full_jitter=True,
+            ))
+        parser_service.save_to_database(candidate, parsed_data)
+    except Retry:
+        raise
+    except Exception as e:
+        # Covers failures outside parse_resume too, such as a missing API key.
+        logger.exception("Error in parse task for candidate %s", candidate_id)
+        Candidate.objects.filter(pk=candidate_id).update(
+            parsing_status='failed', parsing_error=str(e)
+        )
+        invalidate_candidate_cache(candidate_id)
+        raise
+
+
+def queue_resume_parsing(candidate_id: int) -> None:
+    """Queue parse_resume_task under a stable per-candidate task id."""
+    parse_resume_task.apply_async((candidate_id,), task_id=f'parse:{candidate_id}')
+
+
+@shared_task(acks_late=True)
+def parse_resume_batch_task(candidate_ids: List[int]) -> None:
+    """
+    Submit queued candidates to Gemini Batch Mode and start polling.
+    
+    With CELERY_TASK_ALWAYS_EAGER there is no worker to poll the job from,
+    and eager retries ignore their countdown, so each candidate is parsed
+    inline instead. Any other error marks the candidates failed.
+    
+    Args:
+        candidate_ids: Primary keys of the Candidates to parse
+    """
+    candidates = list(Candidate.objects.filter(
+        id__in=candidate_ids, parsing_status__in=['pending', 'queued']
+    ))
+    if not candidates:
+        return
+    
+    if settings.CELERY_TASK_ALWAYS_EAGER:
+        for candidate in candidates:
+            queue_resume_parsing(candidate.id)
+        return
+    
+    submitted_ids = [candidate.id for candidate in candidates]
+    try:
+        job_name = ResumeParserService().parse_resumes_batch(candidates)
+        if job_name is None:
+            return
+        
+        poll_resume_batch_task.apply_async(
+            (job_name, submitted_ids),
+            countdown=settings.RESUME_BATCH_POLL_INTERVAL,
+        )
+    except Exception as e:
+        logger.exception("Error in batch parse task for %d candidates", len(submitted_ids))
+        ResumeParserService.fail_batch_candidates(submitted_ids, str(e))
+        raise
+
+
+@shared_task(bind=True, max_retries=None)
+def poll_resume_batch_task(self, job_name: str, candidate_ids: List[int]) -> None:
+    """
+    Save a batch job's results once it finishes, re-checking until then.
+    
+    API errors while polling are retried like an unfinished job. Polling
+    stops once the job has outlived Gemini's batch lifetime, and any other
+    error ends it too; either way, candidates not yet saved are marked failed.
+    
+    Args:
+        job_name: Gemini batch job name
+        candidate_ids: Primary keys of the Candidates in the job
+    """
+    try:
+        parser_service = ResumeParserService()
+        try:
+            if parser_service.collect_batch_results(job_name, candidate_ids):
+                return
+        except genai_errors.APIError:
+            logger.exception("Error polling batch job %s", job_name)
+        
+        if (self.request.retries + 1) * settings.RESUME_BATCH_POLL_INTERVAL > BATCH_JOB_LIFETIME:
+            logger.error(f"Batch job {job_name} did not finish in time, giving up")
+            parser_service.fail_batch_candidates(candidate_ids, "Batch job did not finish in time")
+            return
+        raise self.retry(countdown=settings.RESUME_BATCH_POLL_INTERVAL)
+    except Retry:
+        raise
+    except Exception as e:
+        # A malformed results file or a missing job.dest would otherwise end
+        # the polling chain with candidates left processing.
+        logger.exception("Error collecting batch job %s", job_name)
+        ResumeParserService.fail_batch_candidates(candidate_ids, str(e))
+        raise
@@ -0,0 +1,43 @@
+"""
+Upload handlers that hash file content while the upload is received.
+"""
+import hashlib
+
+from django.core.files.uploadhandler import (
+    MemoryFileUploadHandler,
+    TemporaryFileUploadHandler,
+)
+
+from .services.hashing import HASH_CHUNK_SIZE
+
+
+class Sha256UploadMixin:
+    """Attach a `sha256` hex digest to each uploaded file."""
+    chunk_size = HASH_CHUNK_SIZE
+    
+    def new_file(self, *args, **kwargs):
+        # Must be set before super(): MemoryFileUploadHandler raises
+        # StopFutureHandlers from new_file once it claims the upload.
+        self.sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+    
+    def receive_data_chunk(self, raw_data, start):
+        # An inactive memory handler passes chunks on to the next handler,
+        # which hashes them instead.
+        if getattr(self, 'activated', True):
+            self.sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+    
+    def file_complete(self, file_size):
+        file_obj = super().file_complete(file_size)
+        if file_obj is not None:
+            file_obj.sha256 = self.sha256.hexdigest()
+        return file_obj
+
+
+class HashingMemoryFileUploadHandler(Sha256UploadMixin, MemoryFileUploadHandler):
+    """In-memory upload handler that hashes chunks as they arrive."""
+
+
+class HashingTemporaryFileUploadHandler(Sha256UploadMixin, TemporaryFileUploadHandler):
+    """Temporary-file upload handler that hashes chunks as they arrive."""
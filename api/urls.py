@@ -1,20 +1,24 @@
 from django.urls import path
 from .views import (
-    HealthCheckView,
+    health_check,
     CandidateUploadView,
     CandidateDetailView,
     CandidateStatusView,
     CandidateListView,
+    CandidateExportView,
     DocumentUploadView,
     DocumentRequestView,
 )
 
+# Ordered by expected traffic: URL resolution tries patterns in order, so
+# health checks and status polling match first.
 urlpatterns = [
-    path('health/', HealthCheckView.as_view(), name='health-check'),
+    path('health/', health_check, name='health-check'),
+    path('candidates/<int:candidate_id>/status/', CandidateStatusView.as_view(), name='candidate-status'),
+    path('candidates/<int:candidate_id>/', CandidateDetailView.as_view(), name='candidate-detail'),
     path('candidates/', CandidateListView.as_view(), name='candidate-list'),
     path('candidates/upload/', CandidateUploadView.as_view(), name='candidate-upload'),
-    path('candidates/<int:candidate_id>/', CandidateDetailView.as_view(), name='candidate-detail'),
-    path('candidates/<int:candidate_id>/status/', CandidateStatusView.as_view(), name='candidate-status'),
+    path('candidates/export/', CandidateExportView.as_view(), name='candidate-export'),
     path('candidates/<int:candidate_id>/submit-documents/', DocumentUploadView.as_view(), name='document-upload'),
     path('candidates/<int:candidate_id>/request-documents/', DocumentRequestView.as_view(), name='document-request'),
 ]
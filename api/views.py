@@ -1,26 +1,147 @@
+import csv
+import hashlib
+import itertools
+import json
 import logging
-import traceback
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition, require_safe
+from google.genai import types
 from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.generics import ListAPIView
+from rest_framework.permissions import IsAdminUser
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
-from .models import Candidate
+from .cache import (
+    CANDIDATE_DETAIL_CACHE_TIMEOUT,
+    CANDIDATE_STATUS_CACHE_TIMEOUT,
+    candidate_detail_cache_key,
+    candidate_status_cache_key,
+    invalidate_candidate_cache,
+)
+from .models import Candidate, Experience
+from .pagination import CandidateCursorPagination
 from .serializers import (
     CandidateUploadSerializer,
     CandidateDetailSerializer,
     CandidateListSerializer,
     DocumentUploadSerializer,
 )
-from .services.resume_parser import ResumeParserService
+from .services.resume_parser import GEMINI_MODEL, get_async_gemini_client
+from .tasks import parse_resume_batch_task, queue_resume_parsing
 
 logger = logging.getLogger(__name__)
 
+CANDIDATE_EXPORT_FIELDS = [
+    'id', 'name', 'email', 'phone', 'location', 'latest_company',
+    'parsing_status', 'confidence_score', 'created_at', 'parsed_at',
+]
+EXPORT_CHUNK_SIZE = 2000
+# Spreadsheet apps evaluate cells starting with these as formulas.
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
 
-class HealthCheckView(APIView):
-    """Lightweight health check endpoint for serverless cold start detection."""
+# JSON mode: the model returns exactly this object, with no code fences.
+# Temperature 0 keeps the output a function of the prompt, so it can be
+# cached by prompt inputs. The fixed instructions live in the system
+# instruction; each request only sends the candidate's details.
+DOCUMENT_REQUEST_CONFIG = types.GenerateContentConfig(
+    system_instruction=(
+        "You write warm, professional HR emails asking a job candidate for their "
+        "Aadhar and PAN documents for verification, as a standard part of the "
+        "hiring process. Give clear instructions, address the candidate by name, "
+        "and sign off as \"HR Team\"."
+    ),
+    temperature=0.0,
+    response_mime_type='application/json',
+    response_schema={
+        'type': 'object',
+        'properties': {
+            'subject': {'type': 'string', 'description': 'Email subject line'},
+            'body': {'type': 'string', 'description': 'Full email body with line breaks'},
+        },
+        'required': ['subject', 'body'],
+    },
+)
+DOCUMENT_REQUEST_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _candidate_detail_etag(request, candidate_id):
+    """ETag for the detail payload, derived from the columns that change it."""
+    # updated_at covers full saves (admin edits) and child row changes; the
+    # other columns are written by narrow UPDATEs that leave it alone.
+    row = Candidate.objects.filter(id=candidate_id).values_list(
+        'updated_at', 'parsed_at', 'parsing_status', 'parsing_error',
+        'aadhar_document', 'pan_document', 'document_request_message',
+    ).first()
+    if row is None:
+        return None
+    etag = hashlib.sha1(repr((candidate_id, *row)).encode()).hexdigest()
+    # Kept for CandidateDetailView.get so the query runs once per request.
+    request.candidate_detail_etag = etag
+    return etag
+
+
+def _get_candidate(candidate_id, queryset=None):
+    """
+    Fetch a candidate or raise a 404 with the API's usual error body.
+    
+    Args:
+        candidate_id: Primary key from the URL
+        queryset: Candidate queryset to fetch from, e.g. with prefetches
+    """
+    if queryset is None:
+        queryset = Candidate.objects.all()
+    try:
+        return queryset.get(id=candidate_id)
+    except Candidate.DoesNotExist:
+        raise NotFound({'error': 'Candidate not found'})
+
+
+def _csv_safe(value):
+    """Quote a resume-supplied string so spreadsheets don't run it as a formula."""
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class _Echo:
+    """Pseudo-buffer that hands csv.writer output straight back."""
     
-    def get(self, request):
-        return Response({'status': 'ok'}, status=status.HTTP_200_OK)
+    def write(self, value):
+        return value
+
+
+def _candidate_detail_queryset():
+    """Candidates with related rows prefetched for CandidateDetailSerializer."""
+    # Every Candidate column is part of the detail payload; only the
+    # prefetched children can be narrowed to the serialized fields.
+    experience = Experience.objects.only(
+        'id', 'candidate_id', 'company', 'position',
+        'start_date', 'end_date', 'description',
+    ).prefetch_related('skills_used')
+    return Candidate.objects.prefetch_related(
+        'education',
+        Prefetch('experience', queryset=experience),
+        'skills',
+        'projects__technologies',
+        'certifications',
+    )
+
+
+@require_safe
+def health_check(request):
+    """Lightweight health check endpoint for serverless cold start detection."""
+    # A plain Django view: load balancers poll this, and DRF's negotiation,
+    # authentication and permission checks add nothing here.
+    return HttpResponse(b'{"status": "ok"}', content_type='application/json')
 
 
 class DocumentUploadView(APIView):
@@ -28,13 +149,7 @@ class DocumentUploadView(APIView):
     parser_classes = [MultiPartParser, FormParser]
     
     def post(self, request, candidate_id, format=None):
-        try:
-            candidate = Candidate.objects.get(id=candidate_id)
-        except Candidate.DoesNotExist:
-            return Response(
-                {'error': 'Candidate not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+        candidate = _get_candidate(candidate_id, queryset=_candidate_detail_queryset())
         
         serializer = DocumentUploadSerializer(
             candidate,
@@ -50,174 +165,221 @@ class DocumentUploadView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class DocumentRequestView(APIView):
+@method_decorator(csrf_exempt, name='dispatch')
+class DocumentRequestView(View):
     """Generate AI-powered personalized document request email."""
     
-    def post(self, request, candidate_id, format=None):
-        import google.generativeai as genai
-        import os
-        import json
-        
+    # Async so the worker isn't held for the Gemini round trip; DRF's
+    # APIView can't dispatch to async handlers, hence a plain Django view.
+    async def post(self, request, candidate_id):
         try:
-            candidate = Candidate.objects.get(id=candidate_id)
+            candidate = await Candidate.objects.only('id', 'name').aget(id=candidate_id)
         except Candidate.DoesNotExist:
-            return Response(
+            return JsonResponse(
                 {'error': 'Candidate not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
         try:
-            api_key = os.getenv('GOOGLE_API_KEY')
-            genai.configure(api_key=api_key)
-            model = genai.GenerativeModel('gemini-2.5-flash')
-            
-            prompt = f"""Generate a professional and personalized email requesting government ID documents from a job candidate.
-
-Candidate Information:
-Name: {candidate.name or 'Candidate'}
-Email: {candidate.email or 'N/A'}
-Position Applied: {candidate.experience.first().position if candidate.experience.exists() else 'N/A'}
-
-CRITICAL: Return ONLY a valid JSON object with exactly this structure:
-{{
-  "subject": "string - email subject line",
-  "body": "string - full email body with proper formatting, use \\n for line breaks"
-}}
-
-The email should:
-- Be warm and professional
-- Explain that we need Aadhar and PAN documents for verification
-- Mention it's a standard part of the hiring process
-- Provide clear instructions
-- Be personalized with the candidate's name
-- End with a professional signature from "HR Team"
-
-Response (JSON only):"""
+            # Latest role by the default start date ordering, in one query.
+            position = await candidate.experience.values_list('position', flat=True).afirst()
             
-            response = model.generate_content(prompt)
-            response_text = response.text.strip()
-            
-            # Extract JSON from response
-            if '```json' in response_text:
-                json_start = response_text.find('```json') + 7
-                json_end = response_text.find('```', json_start)
-                response_text = response_text[json_start:json_end].strip()
-            elif '```' in response_text:
-                json_start = response_text.find('```') + 3
-                json_end = response_text.find('```', json_start)
-                response_text = response_text[json_start:json_end].strip()
-            
-            email_data = json.loads(response_text)
+            # The prompt depends only on these inputs; a change to either
+            # yields a new key, so no explicit invalidation is needed.
+            cache_key = 'docreq:' + hashlib.sha1(
+                f'{candidate.name}|{position}'.encode()
+            ).hexdigest()
+            email_data = await cache.aget(cache_key)
+            if email_data is None:
+                email_data = await self._generate_email(candidate, position)
+                await cache.aset(cache_key, email_data, DOCUMENT_REQUEST_CACHE_TIMEOUT)
             
             # Format the message for storage
             message = f"Subject: {email_data['subject']}\n\n{email_data['body']}"
             
             candidate.document_request_message = message
-            candidate.save()
+            await candidate.asave(update_fields=['document_request_message'])
             
             logger.info(f"Generated document request for candidate {candidate.id}")
             
-            return Response({
+            return JsonResponse({
                 'success': True,
                 'message': 'Document request generated successfully',
                 'email': email_data
             }, status=status.HTTP_200_OK)
             
         except Exception as e:
-            logger.error(f"Error generating document request: {e}")
-            return Response(
+            logger.exception("Error generating document request for candidate %s", candidate_id)
+            return JsonResponse(
                 {'error': f'Failed to generate request: {str(e)}'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+    
+    async def _generate_email(self, candidate, position):
+        """Ask Gemini for the document request email as {'subject', 'body'}."""
+        message = f"Name: {candidate.name or 'Candidate'}\nPosition: {position or 'N/A'}"
+        response = await get_async_gemini_client().models.generate_content(
+            model=GEMINI_MODEL,
+            contents=message,
+            config=DOCUMENT_REQUEST_CONFIG,
+        )
+        return json.loads(response.text)
+
 
+class CandidateListView(ListAPIView):
+    """List candidates with minimal fields, newest first, one page at a time."""
+    serializer_class = CandidateListSerializer
+    pagination_class = CandidateCursorPagination
+    # created_at is read by the paginator to build the next-page cursor.
+    queryset = Candidate.objects.only(
+        'id', 'created_at', 'name', 'email', 'latest_company',
+        'parsing_status', 'confidence_score',
+    )
 
 
 
-class CandidateListView(APIView):
-    """List all candidates with minimal fields."""
+class CandidateExportView(APIView):
+    """Stream every candidate as a CSV download (staff only)."""
+    permission_classes = [IsAdminUser]
     
     def get(self, request, format=None):
-        candidates = Candidate.objects.all()
-        serializer = CandidateListSerializer(candidates, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
-
+        # values_list + iterator keeps memory at one chunk of tuples instead
+        # of materialising every Candidate before the first byte is sent.
+        rows = Candidate.objects.order_by('id').values_list(
+            *CANDIDATE_EXPORT_FIELDS
+        ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        writer = csv.writer(_Echo())
+        response = StreamingHttpResponse(
+            (
+                writer.writerow([_csv_safe(value) for value in row])
+                for row in itertools.chain([CANDIDATE_EXPORT_FIELDS], rows)
+            ),
+            content_type='text/csv',
+        )
+        response['Content-Disposition'] = 'attachment; filename="candidates.csv"'
+        return response
 
 
 class CandidateUploadView(APIView):
-    """Upload resume and trigger parsing."""
+    """Upload resume and queue it for background parsing."""
     parser_classes = [MultiPartParser, FormParser]
     
     def post(self, request, format=None):
-        serializer = CandidateUploadSerializer(data=request.data)
+        files = request.FILES.getlist('resume_file')
+        if (
+            request.query_params.get('mode') == 'batch'
+            or len(files) > settings.RESUME_BATCH_UPLOAD_THRESHOLD
+        ):
+            return self._batch_upload(request, files)
+        
+        serializer = CandidateUploadSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
-            candidate = serializer.save()
+            # Saved as queued before dispatch so an eager or fast worker's
+            # status writes are never overwritten by the view.
+            candidate = serializer.save(parsing_status='queued')
             
-            # Parse the resume using LangChain
+            # Parsing runs on a Celery worker; clients poll the status endpoint.
             try:
-                parser_service = ResumeParserService()
-                parsed_data = parser_service.parse_resume(candidate)
-                parser_service.save_to_database(candidate, parsed_data)
-                
-                # Refresh candidate to get updated data
-                candidate.refresh_from_db()
-                
-                return Response({
-                    'id': candidate.id,
-                    'resume_file': request.build_absolute_uri(candidate.resume_file.url),
-                    'created_at': candidate.created_at,
-                    'parsing_status': candidate.parsing_status,
-                    'message': 'Resume uploaded and parsed successfully',
-                    'candidate_url': request.build_absolute_uri(f'/api/candidates/{candidate.id}/')
-                }, status=status.HTTP_201_CREATED)
-                
+                queue_resume_parsing(candidate.id)
             except Exception as e:
                 error_msg = str(e)
-                error_traceback = traceback.format_exc()
-                logger.error(f"Error parsing resume: {error_msg}")
-                logger.error(f"Full traceback:\n{error_traceback}")
-                print(f"ERROR PARSING RESUME: {error_msg}")
-                print(f"FULL TRACEBACK:\n{error_traceback}")
+                logger.exception("Error queueing resume parsing for candidate %s", candidate.id)
+                candidate.parsing_status = 'failed'
+                candidate.parsing_error = f"Could not queue parsing: {error_msg}"
+                candidate.save(update_fields=['parsing_status', 'parsing_error'])
                 return Response({
-                    'id': candidate.id,
-                    'resume_file': request.build_absolute_uri(candidate.resume_file.url),
-                    'created_at': candidate.created_at,
-                    'parsing_status': 'failed',
+                    **serializer.data,
                     'error': error_msg,
-                    'message': 'Resume uploaded but parsing failed'
+                    'message': 'Resume uploaded but parsing could not be queued'
                 }, status=status.HTTP_201_CREATED)
+            
+            return Response({
+                **serializer.data,
+                'message': 'Resume uploaded and queued for parsing',
+            }, status=status.HTTP_201_CREATED)
                 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    def _batch_upload(self, request, files):
+        """Save every uploaded resume and parse them as one Gemini batch job."""
+        upload_serializers = [CandidateUploadSerializer(data={'resume_file': f}) for f in files]
+        if not upload_serializers:
+            return Response(
+                {'resume_file': ['No file was submitted.']},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        # Validate every file so the error list lines up with the uploads.
+        if not all([serializer.is_valid() for serializer in upload_serializers]):
+            return Response(
+                [serializer.errors for serializer in upload_serializers],
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        with transaction.atomic():
+            candidates = [
+                serializer.save(parsing_status='queued') for serializer in upload_serializers
+            ]
+        
+        try:
+            parse_resume_batch_task.delay([candidate.id for candidate in candidates])
+        except Exception as e:
+            error_msg = str(e)
+            logger.exception("Error queueing batch parsing for %d candidates", len(candidates))
+            candidate_ids = [candidate.id for candidate in candidates]
+            Candidate.objects.filter(id__in=candidate_ids).update(
+                parsing_status='failed',
+                parsing_error=f"Could not queue parsing: {error_msg}",
+            )
+            invalidate_candidate_cache(*candidate_ids)
+            return Response({
+                'error': error_msg,
+                'message': 'Resumes uploaded but parsing could not be queued'
+            }, status=status.HTTP_201_CREATED)
+        
+        return Response({
+            'message': 'Resumes uploaded and queued for batch parsing',
+            'candidates': CandidateUploadSerializer(
+                candidates, many=True, context={'request': request}
+            ).data,
+        }, status=status.HTTP_201_CREATED)
 
 
 class CandidateDetailView(APIView):
     """Retrieve detailed candidate information."""
     
+    @method_decorator(condition(etag_func=_candidate_detail_etag))
     def get(self, request, candidate_id, format=None):
-        try:
-            candidate = Candidate.objects.get(id=candidate_id)
-            serializer = CandidateDetailSerializer(candidate, context={'request': request})
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Candidate.DoesNotExist:
-            return Response(
-                {'error': 'Candidate not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+        etag = getattr(request, 'candidate_detail_etag', None)
+        if etag is None:
+            raise NotFound({'error': 'Candidate not found'})
+        
+        # Keyed by the current ETag, so the body served always matches the
+        # ETag condition() attaches to it. File URLs in the payload are
+        # absolute, so the cached copy is only reused for the same host.
+        cache_key = candidate_detail_cache_key(candidate_id, etag)
+        base_url = request.build_absolute_uri('/')
+        cached = cache.get(cache_key)
+        if cached is not None and cached[0] == base_url:
+            return Response(cached[1], status=status.HTTP_200_OK)
+        
+        candidate = _get_candidate(candidate_id, queryset=_candidate_detail_queryset())
+        data = CandidateDetailSerializer(candidate, context={'request': request}).data
+        cache.set(cache_key, (base_url, data), CANDIDATE_DETAIL_CACHE_TIMEOUT)
+        return Response(data, status=status.HTTP_200_OK)
 
 
 class CandidateStatusView(APIView):
     """Check parsing status of a candidate."""
     
     def get(self, request, candidate_id, format=None):
-        try:
-            candidate = Candidate.objects.get(id=candidate_id)
-            return Response({
-                'id': candidate.id,
-                'parsing_status': candidate.parsing_status,
-                'parsed_at': candidate.parsed_at,
-                'parsing_error': candidate.parsing_error,
-            }, status=status.HTTP_200_OK)
-        except Candidate.DoesNotExist:
-            return Response(
-                {'error': 'Candidate not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+        cache_key = candidate_status_cache_key(candidate_id)
+        data = cache.get(cache_key)
+        if data is None:
+            # A plain dict straight from the cursor; no model instance needed.
+            data = Candidate.objects.filter(id=candidate_id).values(
+                'id', 'parsing_status', 'parsed_at', 'parsing_error'
+            ).first()
+            if data is None:
+                raise NotFound({'error': 'Candidate not found'})
+            cache.set(cache_key, data, CANDIDATE_STATUS_CACHE_TIMEOUT)
+        return Response(data, status=status.HTTP_200_OK)
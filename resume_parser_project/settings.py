@@ -77,6 +77,26 @@ DATABASES = {
     )
 }
 
+# Cache
+# Redis is shared by every web and worker process. Without REDIS_URL caching
+# is disabled: a per-process cache would never see invalidations made by
+# the Celery worker and would serve stale parsing status.
+REDIS_URL = os.getenv('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': REDIS_URL,
+            'OPTIONS': {'CLIENT_CLASS': 'django_redis.client.DefaultClient'},
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        }
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -118,6 +138,16 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# File uploads
+# Small resumes stay in memory; anything over 1MB streams to a temp file so
+# per-request memory stays bounded. Both handlers hash the content in 64KB
+# chunks as it is received.
+FILE_UPLOAD_HANDLERS = [
+    'api.uploadhandlers.HashingMemoryFileUploadHandler',
+    'api.uploadhandlers.HashingTemporaryFileUploadHandler',
+]
+FILE_UPLOAD_MAX_MEMORY_SIZE = 1024 * 1024
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
@@ -135,6 +165,20 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Celery
+# Resume parsing runs on a worker: celery -A resume_parser_project worker -l info
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+# Run tasks inline (no broker/worker needed), e.g. for local development
+CELERY_TASK_ALWAYS_EAGER = os.getenv('CELERY_TASK_ALWAYS_EAGER', 'False') == 'True'
+
+# Gemini Batch Mode: uploads with more files than this (or ?mode=batch)
+# are parsed as one batch job, which is polled every interval seconds.
+RESUME_BATCH_UPLOAD_THRESHOLD = int(os.getenv('RESUME_BATCH_UPLOAD_THRESHOLD', '5'))
+RESUME_BATCH_POLL_INTERVAL = int(os.getenv('RESUME_BATCH_POLL_INTERVAL', '300'))
+
 # CORS Configuration
 # Note: Allows credentials (cookies) which requires specific origins (no wildcard *)
 CORS_ALLOW_ALL_ORIGINS = False # Must be False when Credentials=True